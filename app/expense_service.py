@@ -1,14 +1,19 @@
 from decimal import Decimal
-from typing import List, Optional
-from sqlmodel import select, desc
+from typing import Dict, List, Optional
+from sqlmodel import select, desc, func
 from app.database import get_session
-from app.models import Expense, ExpenseCreate
+from app.models import DEFAULT_CURRENCY, Expense, ExpenseCreate, from_minor_units, normalize_currency, to_minor_units
 
 
 def create_expense(expense_data: ExpenseCreate) -> Expense:
     """Create a new expense in the database."""
     with get_session() as session:
-        expense = Expense(description=expense_data.description, amount=expense_data.amount, date=expense_data.date)
+        expense = Expense(
+            description=expense_data.description,
+            amount_minor=to_minor_units(expense_data.amount, expense_data.currency),
+            currency=expense_data.currency,
+            date=expense_data.date,
+        )
         session.add(expense)
         session.commit()
         session.refresh(expense)
@@ -41,10 +46,22 @@ def delete_expense(expense_id: int) -> bool:
         return True
 
 
-def get_total_expenses() -> Decimal:
-    """Calculate the total amount of all expenses."""
+def get_total_expenses(currency: str = DEFAULT_CURRENCY) -> Decimal:
+    """Calculate the total amount of all expenses in the given currency."""
+    currency = normalize_currency(currency)
     with get_session() as session:
-        statement = select(Expense)
-        expenses = session.exec(statement).all()
-        total = sum(expense.amount for expense in expenses)
-        return total if isinstance(total, Decimal) else Decimal("0")
+        statement = select(func.coalesce(func.sum(Expense.amount_minor), 0)).where(Expense.currency == currency)
+        total_minor = session.exec(statement).one()
+        return from_minor_units(int(total_minor), currency)
+
+
+def get_totals_by_currency() -> Dict[str, Decimal]:
+    """Calculate the total amount of all expenses for each currency that has expenses."""
+    with get_session() as session:
+        statement = (
+            select(Expense.currency, func.sum(Expense.amount_minor))
+            .group_by(Expense.currency)
+            .order_by(Expense.currency)
+        )
+        rows = session.exec(statement).all()
+        return {currency: from_minor_units(int(total_minor), currency) for currency, total_minor in rows}
@@ -1,8 +1,21 @@
-from decimal import Decimal
 from datetime import date
+from decimal import Decimal
 from nicegui import ui
-from app.expense_service import create_expense, get_all_expenses, delete_expense, get_total_expenses
-from app.models import ExpenseCreate
+from app.expense_service import create_expense, get_all_expenses, delete_expense, get_totals_by_currency
+from app.models import (
+    CURRENCY_EXPONENTS,
+    CURRENCY_SYMBOLS,
+    DEFAULT_CURRENCY,
+    ExpenseCreate,
+    from_minor_units,
+    to_minor_units,
+)
+
+
+def format_amount(amount: Decimal, currency: str) -> str:
+    """Format an amount with its currency symbol and the currency's number of decimal places."""
+    symbol = CURRENCY_SYMBOLS.get(currency, f"{currency} ")
+    return f"{symbol}{amount:.{CURRENCY_EXPONENTS[currency]}f}"
 
 
 def create():
@@ -58,8 +71,10 @@ def create():
 
         # Function to refresh all data
         def refresh_data():
-            total = get_total_expenses()
-            total_label.text = f"Total: ${total:.2f}"
+            totals = get_totals_by_currency() or {DEFAULT_CURRENCY: Decimal("0")}
+            total_label.text = "Total: " + " · ".join(
+                format_amount(total, currency) for currency, total in totals.items()
+            )
             refresh_expense_list(table_container, refresh_data)
 
         # Add expense function
@@ -75,7 +90,8 @@ def create():
 
                 expense_data = ExpenseCreate(
                     description=description_input.value.strip(),
-                    amount=Decimal(str(amount_input.value)),
+                    # Round the float input to whole cents before it reaches the model
+                    amount=from_minor_units(to_minor_units(amount_input.value)),
                     date=date_input.value,
                 )
 
@@ -119,7 +135,7 @@ def refresh_expense_list(table_container, refresh_callback):
                         ui.label(expense.description).classes("font-medium")
                         ui.label(expense.date.strftime("%Y-%m-%d")).classes("text-sm text-gray-500")
                     with ui.column().classes("items-end"):
-                        ui.label(f"${expense.amount:.2f}").classes("text-lg font-bold")
+                        ui.label(format_amount(expense.amount, expense.currency)).classes("text-lg font-bold")
                         if expense.id is not None:
                             ui.button(
                                 "Delete",
@@ -1,28 +1,144 @@
-from sqlmodel import SQLModel, Field
+from sqlalchemy import BigInteger
+from pydantic import field_validator, model_validator
+from sqlmodel import SQLModel, Field, UniqueConstraint
 from datetime import datetime, date as Date
-from decimal import Decimal
-from typing import Optional
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from enum import Enum
+from typing import Optional, Union
+
+
+# Amounts are stored as integer minor units; the exponent is the number of minor-unit digits per currency.
+# AMOUNT_MAX_DIGITS keeps validated amounts within the BIGINT range of the amount_minor columns.
+DEFAULT_CURRENCY = "USD"
+AMOUNT_MAX_DIGITS = 17
+CURRENCY_EXPONENTS = {"USD": 2, "EUR": 2, "GBP": 2, "JPY": 0}
+CURRENCY_SYMBOLS = {"USD": "$", "EUR": "€", "GBP": "£", "JPY": "¥"}
+
+
+def normalize_currency(currency: str) -> str:
+    """Uppercase a currency code and check that it is supported. Raises ValueError otherwise."""
+    code = currency.upper()
+    if code not in CURRENCY_EXPONENTS:
+        raise ValueError(f"Unsupported currency: {currency}")
+    return code
+
+
+def check_amount_precision(amount: Decimal, currency: str) -> Decimal:
+    """Reject amounts with more decimal places than the currency's minor unit allows."""
+    try:
+        quantized = amount.quantize(Decimal(1).scaleb(-CURRENCY_EXPONENTS[currency]))
+    except InvalidOperation as e:
+        raise ValueError(f"Amount {amount} is out of range") from e
+    if amount != quantized:
+        raise ValueError(f"Amount {amount} has more decimal places than {currency} allows")
+    return amount
+
+
+def to_minor_units(amount: Union[Decimal, float, str], currency: str = DEFAULT_CURRENCY) -> int:
+    """Convert a major-unit amount (e.g. dollars) to integer minor units (e.g. cents), rounding half up."""
+    exponent = CURRENCY_EXPONENTS[normalize_currency(currency)]
+    try:
+        value = Decimal(str(amount)).scaleb(exponent).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    except InvalidOperation as e:
+        raise ValueError(f"Invalid amount: {amount}") from e
+    return int(value)
+
+
+def from_minor_units(amount_minor: int, currency: str = DEFAULT_CURRENCY) -> Decimal:
+    """Convert integer minor units back to an exact major-unit Decimal."""
+    return Decimal(amount_minor).scaleb(-CURRENCY_EXPONENTS[normalize_currency(currency)])
+
+
+# Named explicitly so the migration in app.database can check for it on existing tables.
+EXPENSES_RECURRING_DATE_KEY = "expenses_recurring_expense_id_date_key"
+
+
+class RecurrenceFrequency(str, Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
 
 
 # Persistent models (stored in database)
 class Expense(SQLModel, table=True):
     __tablename__ = "expenses"  # type: ignore[assignment]
+    # One row per (rule, date) keeps recurring materialization idempotent; manual expenses have a NULL rule id.
+    __table_args__ = (UniqueConstraint("recurring_expense_id", "date", name=EXPENSES_RECURRING_DATE_KEY),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     description: str = Field(max_length=500)
-    amount: Decimal = Field(decimal_places=2)
+    amount_minor: int = Field(sa_type=BigInteger)
+    currency: str = Field(default=DEFAULT_CURRENCY, max_length=3)
     date: Date = Field()
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    recurring_expense_id: Optional[int] = Field(default=None, foreign_key="recurring_expenses.id", ondelete="SET NULL")
+
+    @property
+    def amount(self) -> Decimal:
+        return from_minor_units(self.amount_minor, self.currency)
+
+
+class RecurringExpense(SQLModel, table=True):
+    __tablename__ = "recurring_expenses"  # type: ignore[assignment]
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    description: str = Field(max_length=500)
+    amount_minor: int = Field(sa_type=BigInteger)
+    currency: str = Field(default=DEFAULT_CURRENCY, max_length=3)
+    frequency: RecurrenceFrequency = Field()
+    interval: int = Field(default=1, ge=1)
+    start_date: Date = Field()
+    end_date: Optional[Date] = Field(default=None)
+    # Materialization cursor: index and date of the first occurrence not yet written to expenses.
+    next_index: int = Field(default=0)
+    next_date: Optional[Date] = Field(default=None, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def amount(self) -> Decimal:
+        return from_minor_units(self.amount_minor, self.currency)
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
 class ExpenseCreate(SQLModel, table=False):
     description: str = Field(max_length=500)
-    amount: Decimal = Field(decimal_places=2)
+    amount: Decimal = Field(max_digits=AMOUNT_MAX_DIGITS, decimal_places=2)
+    currency: str = Field(default=DEFAULT_CURRENCY, max_length=3)
     date: Date
 
+    @field_validator("currency")
+    @classmethod
+    def validate_currency(cls, value: str) -> str:
+        return normalize_currency(value)
+
+    @model_validator(mode="after")
+    def validate_amount_precision(self):
+        check_amount_precision(self.amount, self.currency)
+        return self
+
+
+class RecurringExpenseCreate(SQLModel, table=False):
+    description: str = Field(max_length=500)
+    amount: Decimal = Field(max_digits=AMOUNT_MAX_DIGITS, decimal_places=2)
+    currency: str = Field(default=DEFAULT_CURRENCY, max_length=3)
+    frequency: RecurrenceFrequency
+    interval: int = Field(default=1, ge=1)
+    start_date: Date
+    end_date: Optional[Date] = Field(default=None)
+
+    @field_validator("currency")
+    @classmethod
+    def validate_currency(cls, value: str) -> str:
+        return normalize_currency(value)
+
+    @model_validator(mode="after")
+    def validate_amount_precision(self):
+        check_amount_precision(self.amount, self.currency)
+        return self
 
-class ExpenseUpdate(SQLModel, table=False):
-    description: Optional[str] = Field(default=None, max_length=500)
-    amount: Optional[Decimal] = Field(default=None, decimal_places=2)
-    date: Optional[Date] = Field(default=None)
+    @model_validator(mode="after")
+    def validate_date_range(self):
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("End date must not be before start date")
+        return self
@@ -0,0 +1,133 @@
+import calendar
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select, col
+from app.database import get_session
+from app.models import Expense, RecurrenceFrequency, RecurringExpense, RecurringExpenseCreate, to_minor_units
+
+# Rows per multi-row INSERT; keeps a long catch-up well below PostgreSQL's bind parameter limit.
+INSERT_BATCH_SIZE = 1000
+
+
+def occurrence_date(rule: RecurringExpense, index: int) -> date:
+    """Return the date of the index-th occurrence of a rule (0 is the start date).
+
+    Dates are always derived from the start date rather than from the previous occurrence, so a rule
+    anchored on the 31st lands on the last day of shorter months without drifting afterwards.
+    """
+    step = index * rule.interval
+    if rule.frequency == RecurrenceFrequency.DAILY:
+        return rule.start_date + timedelta(days=step)
+    if rule.frequency == RecurrenceFrequency.WEEKLY:
+        return rule.start_date + timedelta(weeks=step)
+
+    months = step * 12 if rule.frequency == RecurrenceFrequency.YEARLY else step
+    year, month = divmod(rule.start_date.month - 1 + months, 12)
+    year += rule.start_date.year
+    day = min(rule.start_date.day, calendar.monthrange(year, month + 1)[1])
+    return date(year, month + 1, day)
+
+
+def due_occurrences(rule: RecurringExpense, until: date) -> Tuple[List[date], int, Optional[date]]:
+    """Collect the rule's unmaterialized occurrences up to and including `until`.
+
+    Returns the due dates along with the advanced cursor (next index and next date, None once the rule is exhausted).
+    """
+    dates: List[date] = []
+    index = rule.next_index
+    current: Optional[date] = occurrence_date(rule, index)
+    while current is not None and current <= until:
+        dates.append(current)
+        index += 1
+        current = occurrence_date(rule, index)
+        if rule.end_date is not None and current > rule.end_date:
+            current = None
+    return dates, index, current
+
+
+def create_recurring_expense(rule_data: RecurringExpenseCreate) -> RecurringExpense:
+    """Create a new recurring expense rule in the database."""
+    with get_session() as session:
+        rule = RecurringExpense(
+            description=rule_data.description,
+            amount_minor=to_minor_units(rule_data.amount, rule_data.currency),
+            currency=rule_data.currency,
+            frequency=rule_data.frequency,
+            interval=rule_data.interval,
+            start_date=rule_data.start_date,
+            end_date=rule_data.end_date,
+            next_index=0,
+            next_date=rule_data.start_date,
+        )
+        session.add(rule)
+        session.commit()
+        session.refresh(rule)
+        return rule
+
+
+def get_all_recurring_expenses() -> List[RecurringExpense]:
+    """Retrieve all recurring expense rules, ordered by start date."""
+    with get_session() as session:
+        statement = select(RecurringExpense).order_by(col(RecurringExpense.start_date))
+        rules = session.exec(statement).all()
+        return list(rules)
+
+
+def delete_recurring_expense(rule_id: int) -> bool:
+    """Delete a recurring expense rule by ID. Already materialized expenses are kept."""
+    with get_session() as session:
+        rule = session.get(RecurringExpense, rule_id)
+        if rule is None:
+            return False
+        session.delete(rule)
+        session.commit()
+        return True
+
+
+def materialize_due_expenses(today: Optional[date] = None) -> int:
+    """Write every due occurrence of every recurring rule to the expenses table.
+
+    All due rules are loaded in one query and their occurrences are written with batched multi-row
+    inserts in a single transaction, so catching up after downtime needs no per-occurrence round-trips.
+    Rows that already exist for a (rule, date) pair are skipped, which makes re-runs safe, and due rules
+    are row-locked so concurrent runs do not process the same rule twice. Returns the number of expenses inserted.
+    """
+    until = today or date.today()
+    now = datetime.utcnow()
+    with get_session() as session:
+        statement = (
+            select(RecurringExpense)
+            .where(col(RecurringExpense.next_date).is_not(None), col(RecurringExpense.next_date) <= until)
+            .with_for_update(skip_locked=True)
+        )
+        rules = session.exec(statement).all()
+
+        rows = []
+        for rule in rules:
+            dates, rule.next_index, rule.next_date = due_occurrences(rule, until)
+            rows.extend(
+                {
+                    "description": rule.description,
+                    "amount_minor": rule.amount_minor,
+                    "currency": rule.currency,
+                    "date": occurrence,
+                    "created_at": now,
+                    "recurring_expense_id": rule.id,
+                }
+                for occurrence in dates
+            )
+            session.add(rule)
+
+        inserted = 0
+        connection = session.connection()
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            result = connection.execute(
+                insert(Expense)
+                .values(rows[start : start + INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=["recurring_expense_id", "date"])
+                .returning(col(Expense.id))
+            )
+            inserted += len(result.all())
+        session.commit()
+        return inserted
@@ -1,9 +1,24 @@
 from app.database import create_tables
-from nicegui import app
+from nicegui import app as nicegui_app, run
 import app.expense_ui
+import app.recurring_service
+
+# How often (in seconds) due recurring expenses are written to the expenses table.
+RECURRING_EXPENSES_INTERVAL = 3600
+
+
+async def materialize_recurring_expenses() -> None:
+    # Run the database work off the event loop so a long catch-up does not block connected clients
+    await run.io_bound(app.recurring_service.materialize_due_expenses)
+
+
+def start_recurring_scheduler() -> None:
+    # Runs immediately on startup to catch up on occurrences missed while the app was down.
+    nicegui_app.timer(RECURRING_EXPENSES_INTERVAL, materialize_recurring_expenses)
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
     app.expense_ui.create()
+    start_recurring_scheduler()
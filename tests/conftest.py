@@ -7,6 +7,8 @@ pytest_plugins = ['nicegui.testing.plugin']
 
 
 @pytest.fixture
-def user(user: User) -> Generator[User, None, None]:
+def user(user: User, monkeypatch: pytest.MonkeyPatch) -> Generator[User, None, None]:
+    # Keep the recurring expenses timer from writing to the database while tests reset it
+    monkeypatch.setattr("app.startup.start_recurring_scheduler", lambda: None)
     startup()
     yield user
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import inspect
+from decimal import Decimal
+from sqlmodel import SQLModel, text
+from app.database import ENGINE, create_tables, reset_db
+from app.expense_service import get_all_expenses
+from app.models import EXPENSES_RECURRING_DATE_KEY
+
+
+@pytest.fixture()
+def baseline_db():
+    """Recreate the expenses table as it was created before recurring expenses and minor units."""
+    SQLModel.metadata.drop_all(ENGINE)
+    with ENGINE.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE expenses ("
+            "id SERIAL PRIMARY KEY, "
+            "description VARCHAR(500) NOT NULL, "
+            "amount NUMERIC NOT NULL, "
+            "date DATE NOT NULL, "
+            "created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL)"
+        ))
+        conn.execute(text(
+            "INSERT INTO expenses (description, amount, date, created_at) "
+            "VALUES ('Rent', 1234.56, '2024-01-01', '2024-01-01 00:00:00')"
+        ))
+    yield
+    reset_db()
+
+
+def test_create_tables_migrates_baseline_expenses(baseline_db):
+    """Test that create_tables upgrades an existing expenses table and can run again."""
+    create_tables()
+    create_tables()
+
+    inspector = inspect(ENGINE)
+    columns = {column["name"] for column in inspector.get_columns("expenses")}
+    unique_constraints = {constraint["name"] for constraint in inspector.get_unique_constraints("expenses")}
+    assert "recurring_expense_id" in columns
+    assert EXPENSES_RECURRING_DATE_KEY in unique_constraints
+    assert "amount" not in columns
+    assert {"amount_minor", "currency"} <= columns
+
+    expenses = get_all_expenses()
+    assert len(expenses) == 1
+    assert expenses[0].amount_minor == 123456
+    assert expenses[0].amount == Decimal("1234.56")
+    assert expenses[0].currency == "USD"
@@ -1,8 +1,16 @@
 import pytest
 from decimal import Decimal
+from pydantic import ValidationError
 from datetime import date
-from app.expense_service import create_expense, get_all_expenses, get_expense_by_id, delete_expense, get_total_expenses
-from app.models import ExpenseCreate
+from app.expense_service import (
+    create_expense,
+    get_all_expenses,
+    get_expense_by_id,
+    delete_expense,
+    get_total_expenses,
+    get_totals_by_currency,
+)
+from app.models import ExpenseCreate, from_minor_units, to_minor_units
 from app.database import reset_db
 
 
@@ -22,6 +30,8 @@ def test_create_expense(new_db):
     assert expense.id is not None
     assert expense.description == "Lunch at restaurant"
     assert expense.amount == Decimal("25.50")
+    assert expense.amount_minor == 2550
+    assert expense.currency == "USD"
     assert expense.date == date(2024, 1, 15)
     assert expense.created_at is not None
 
@@ -145,3 +155,80 @@ def test_expense_ordering_by_date(new_db):
     assert expenses[0].id == expense2.id  # Newest first
     assert expenses[1].id == expense3.id  # Middle
     assert expenses[2].id == expense1.id  # Oldest last
+
+
+def test_minor_units_round_trip():
+    """Test converting amounts to integer minor units and back."""
+    assert to_minor_units(Decimal("25.50")) == 2550
+    assert to_minor_units(0.1 + 0.2) == 30
+    assert to_minor_units(12.345) == 1235
+    assert to_minor_units(Decimal("1500"), "JPY") == 1500
+    assert from_minor_units(2550) == Decimal("25.50")
+    assert from_minor_units(1500, "JPY") == Decimal("1500")
+
+
+def test_get_total_expenses_exact_cents(new_db):
+    """Test that totals are exact where float addition would drift."""
+    for _ in range(10):
+        create_expense(ExpenseCreate(description="Dime", amount=Decimal("0.10"), date=date(2024, 1, 1)))
+
+    assert get_total_expenses() == Decimal("1.00")
+
+
+def test_get_total_expenses_per_currency(new_db):
+    """Test that totals only include expenses in the requested currency."""
+    create_expense(ExpenseCreate(description="Coffee", amount=Decimal("4.50"), date=date(2024, 1, 1)))
+    create_expense(ExpenseCreate(description="Train", amount=Decimal("12.00"), currency="EUR", date=date(2024, 1, 2)))
+
+    assert get_total_expenses() == Decimal("4.50")
+    assert get_total_expenses("EUR") == Decimal("12.00")
+
+
+def test_expense_create_normalizes_currency():
+    """Test that currency codes are uppercased."""
+    expense_data = ExpenseCreate(description="Lunch", amount=Decimal("8.00"), currency="eur", date=date(2024, 1, 1))
+    assert expense_data.currency == "EUR"
+
+
+def test_expense_create_rejects_unsupported_currency():
+    """Test that unknown currencies fail validation instead of at insert time."""
+    with pytest.raises(ValidationError):
+        ExpenseCreate(description="Lunch", amount=Decimal("8.00"), currency="CAD", date=date(2024, 1, 1))
+
+    with pytest.raises(ValueError):
+        get_total_expenses("CAD")
+
+
+def test_expense_create_rejects_excess_precision():
+    """Test that amounts finer than the currency's minor unit are rejected, not rounded."""
+    with pytest.raises(ValidationError):
+        ExpenseCreate(description="Sushi", amount=Decimal("12.34"), currency="JPY", date=date(2024, 1, 1))
+
+    expense_data = ExpenseCreate(description="Sushi", amount=Decimal("1500.00"), currency="JPY", date=date(2024, 1, 1))
+    assert to_minor_units(expense_data.amount, expense_data.currency) == 1500
+
+
+def test_get_totals_by_currency(new_db):
+    """Test that totals are grouped by currency."""
+    create_expense(ExpenseCreate(description="Coffee", amount=Decimal("4.50"), date=date(2024, 1, 1)))
+    create_expense(ExpenseCreate(description="Tea", amount=Decimal("3.25"), date=date(2024, 1, 2)))
+    create_expense(ExpenseCreate(description="Train", amount=Decimal("12.00"), currency="EUR", date=date(2024, 1, 3)))
+
+    assert get_totals_by_currency() == {"EUR": Decimal("12.00"), "USD": Decimal("7.75")}
+
+
+def test_get_totals_by_currency_empty(new_db):
+    """Test that there are no totals without expenses."""
+    assert get_totals_by_currency() == {}
+
+
+def test_expense_create_rejects_oversized_amount():
+    """Test that amounts too large for BIGINT minor units fail validation."""
+    with pytest.raises(ValidationError):
+        ExpenseCreate(description="Yacht", amount=Decimal("1e20"), date=date(2024, 1, 1))
+
+    with pytest.raises(ValidationError):
+        ExpenseCreate(description="Yacht", amount=Decimal("1e30"), date=date(2024, 1, 1))
+
+    with pytest.raises(ValueError):
+        to_minor_units(Decimal("1e30"))
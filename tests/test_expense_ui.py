@@ -184,3 +184,18 @@ async def test_multiple_expenses_total_calculation(user: User, new_db) -> None:
 
     # Total should be 10.25 + 20.50 + 15.75 = 46.50
     await user.should_see("Total: $46.50")
+
+
+async def test_multiple_currencies_display(user: User, new_db) -> None:
+    """Test that each expense shows its own currency and totals are shown per currency."""
+    create_expense(ExpenseCreate(description="Coffee", amount=Decimal("4.50"), date=date(2024, 1, 10)))
+
+    create_expense(ExpenseCreate(description="Train", amount=Decimal("12.00"), currency="EUR", date=date(2024, 1, 12)))
+
+    create_expense(ExpenseCreate(description="Sushi", amount=Decimal("1500"), currency="JPY", date=date(2024, 1, 15)))
+
+    await user.open("/")
+
+    await user.should_see("€12.00")
+    await user.should_see("¥1500")
+    await user.should_see("Total: €12.00 · ¥1500 · $4.50")
@@ -0,0 +1,193 @@
+import pytest
+from decimal import Decimal
+from pydantic import ValidationError
+from datetime import date
+from app.expense_service import get_all_expenses, get_total_expenses
+from app.recurring_service import (
+    create_recurring_expense,
+    delete_recurring_expense,
+    get_all_recurring_expenses,
+    materialize_due_expenses,
+    occurrence_date,
+)
+from app.models import RecurrenceFrequency, RecurringExpense, RecurringExpenseCreate
+from app.database import reset_db
+
+
+@pytest.fixture()
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+def test_occurrence_date_monthly_clamps_to_month_end():
+    """Test that a monthly rule anchored on the 31st clamps without drifting."""
+    rule = RecurringExpense(
+        description="Rent",
+        amount_minor=100000,
+        frequency=RecurrenceFrequency.MONTHLY,
+        start_date=date(2024, 1, 31),
+    )
+
+    assert occurrence_date(rule, 0) == date(2024, 1, 31)
+    assert occurrence_date(rule, 1) == date(2024, 2, 29)
+    assert occurrence_date(rule, 2) == date(2024, 3, 31)
+    assert occurrence_date(rule, 12) == date(2025, 1, 31)
+
+
+def test_occurrence_date_weekly_with_interval():
+    """Test a biweekly rule."""
+    rule = RecurringExpense(
+        description="Cleaning",
+        amount_minor=5000,
+        frequency=RecurrenceFrequency.WEEKLY,
+        interval=2,
+        start_date=date(2024, 1, 1),
+    )
+
+    assert occurrence_date(rule, 1) == date(2024, 1, 15)
+    assert occurrence_date(rule, 3) == date(2024, 2, 12)
+
+
+def test_occurrence_date_yearly_leap_day():
+    """Test that a yearly rule on Feb 29 falls back to Feb 28 in common years."""
+    rule = RecurringExpense(
+        description="Domain renewal",
+        amount_minor=1200,
+        frequency=RecurrenceFrequency.YEARLY,
+        start_date=date(2024, 2, 29),
+    )
+
+    assert occurrence_date(rule, 1) == date(2025, 2, 28)
+    assert occurrence_date(rule, 4) == date(2028, 2, 29)
+
+
+def test_create_recurring_expense(new_db):
+    """Test creating a recurring expense rule."""
+    rule = create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Streaming subscription",
+            amount=Decimal("9.99"),
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=date(2024, 1, 5),
+        )
+    )
+
+    assert rule.id is not None
+    assert rule.next_index == 0
+    assert rule.next_date == date(2024, 1, 5)
+    assert len(get_all_recurring_expenses()) == 1
+
+
+def test_recurring_expense_create_rejects_end_before_start():
+    """Test that a rule ending before it starts fails validation."""
+    with pytest.raises(ValidationError):
+        RecurringExpenseCreate(
+            description="Backwards",
+            amount=Decimal("10.00"),
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=date(2024, 3, 1),
+            end_date=date(2024, 2, 1),
+        )
+
+
+def test_materialize_catches_up_after_downtime(new_db):
+    """Test that all missed occurrences are written in one run."""
+    create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Rent",
+            amount=Decimal("1200.00"),
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=date(2024, 1, 1),
+        )
+    )
+
+    inserted = materialize_due_expenses(today=date(2024, 6, 15))
+
+    assert inserted == 6
+    expenses = get_all_expenses()
+    assert [expense.date for expense in expenses] == [date(2024, month, 1) for month in range(6, 0, -1)]
+    assert all(expense.description == "Rent" for expense in expenses)
+    assert get_total_expenses() == Decimal("7200.00")
+
+    rule = get_all_recurring_expenses()[0]
+    assert rule.next_index == 6
+    assert rule.next_date == date(2024, 7, 1)
+
+
+def test_materialize_is_idempotent(new_db):
+    """Test that re-running materialization does not duplicate expenses."""
+    create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Gym",
+            amount=Decimal("30.00"),
+            frequency=RecurrenceFrequency.WEEKLY,
+            start_date=date(2024, 1, 1),
+        )
+    )
+
+    assert materialize_due_expenses(today=date(2024, 1, 20)) == 3
+    assert materialize_due_expenses(today=date(2024, 1, 20)) == 0
+    assert materialize_due_expenses(today=date(2024, 1, 22)) == 1
+    assert len(get_all_expenses()) == 4
+
+
+def test_materialize_respects_end_date(new_db):
+    """Test that no occurrences are written past the rule's end date."""
+    create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Course installment",
+            amount=Decimal("100.00"),
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=date(2024, 1, 10),
+            end_date=date(2024, 3, 10),
+        )
+    )
+
+    assert materialize_due_expenses(today=date(2024, 12, 31)) == 3
+
+    rule = get_all_recurring_expenses()[0]
+    assert rule.next_date is None
+    assert materialize_due_expenses(today=date(2025, 12, 31)) == 0
+
+
+def test_materialize_nothing_due(new_db):
+    """Test that rules starting in the future are left alone."""
+    create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Insurance",
+            amount=Decimal("80.00"),
+            frequency=RecurrenceFrequency.YEARLY,
+            start_date=date(2024, 6, 1),
+        )
+    )
+
+    assert materialize_due_expenses(today=date(2024, 5, 31)) == 0
+    assert get_all_expenses() == []
+
+
+def test_delete_recurring_expense_keeps_expenses(new_db):
+    """Test that deleting a rule keeps its materialized expenses."""
+    rule = create_recurring_expense(
+        RecurringExpenseCreate(
+            description="Phone plan",
+            amount=Decimal("25.00"),
+            frequency=RecurrenceFrequency.MONTHLY,
+            start_date=date(2024, 1, 1),
+        )
+    )
+    materialize_due_expenses(today=date(2024, 2, 1))
+
+    if rule.id is not None:
+        assert delete_recurring_expense(rule.id) is True
+
+    assert get_all_recurring_expenses() == []
+    expenses = get_all_expenses()
+    assert len(expenses) == 2
+    assert all(expense.recurring_expense_id is None for expense in expenses)
+
+
+def test_delete_recurring_expense_not_exists(new_db):
+    """Test deleting a rule that doesn't exist."""
+    assert delete_recurring_expense(999) is False